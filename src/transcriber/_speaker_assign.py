@@ -0,0 +1,95 @@
+"""Speaker assignment kernels for combining transcription with diarization."""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _assign_kernel(mids: np.ndarray, turn_starts: np.ndarray, turn_ends: np.ndarray,
+                   max_ends: np.ndarray, label_idx: np.ndarray) -> np.ndarray:
+    """Binary-search each midpoint in the sorted turns (compiled by Numba when available)."""
+    out = np.empty(mids.size, dtype=np.int32)
+    for i in range(mids.size):
+        m = mids[i]
+
+        # Index of the first turn starting after the midpoint
+        lo = 0
+        hi = turn_starts.size
+        while lo < hi:
+            half = (lo + hi) // 2
+            if turn_starts[half] <= m:
+                lo = half + 1
+            else:
+                hi = half
+
+        # Walk back only while some earlier turn still reaches the midpoint
+        found = -1
+        j = lo - 1
+        while j >= 0 and max_ends[j] >= m:
+            if turn_ends[j] >= m:
+                found = label_idx[j]
+                break
+            j -= 1
+        out[i] = found
+    return out
+
+
+def _assign_numpy(mids: np.ndarray, turn_starts: np.ndarray, turn_ends: np.ndarray,
+                  max_ends: np.ndarray, label_idx: np.ndarray) -> np.ndarray:
+    """Vectorized NumPy equivalent of _assign_kernel."""
+    out = np.full(mids.size, -1, dtype=np.int32)
+    pos = np.searchsorted(turn_starts, mids, side="right") - 1
+    valid = pos >= 0
+
+    # Common case: the latest turn starting before the midpoint contains it
+    hit = valid.copy()
+    hit[valid] = mids[valid] <= turn_ends[pos[valid]]
+    out[hit] = label_idx[pos[hit]]
+
+    # Rare case: it ended early, but a longer overlapping turn still covers the midpoint
+    overlap = valid & ~hit
+    overlap[overlap] = max_ends[pos[overlap]] >= mids[overlap]
+    for i in np.flatnonzero(overlap):
+        m = mids[i]
+        j = pos[i] - 1
+        while turn_ends[j] < m:
+            j -= 1
+        out[i] = label_idx[j]
+    return out
+
+
+if njit is not None:
+    _assign_kernel = njit(cache=True)(_assign_kernel)
+
+
+def assign_speakers(mids: np.ndarray, turn_starts: np.ndarray, turn_ends: np.ndarray,
+                    label_idx: np.ndarray) -> np.ndarray:
+    """
+    Find the speaker turn containing each segment midpoint.
+
+    Each midpoint is matched to the latest-starting turn that contains it.
+    Turns are sorted by start, and a running maximum of their ends acts as a
+    small static interval index: a binary search finds the candidate turn,
+    and the running maximum tells whether any earlier overlapping turn can
+    still cover the midpoint, so lookups stay O(log M) unless turns overlap.
+
+    Args:
+        mids: Segment midpoints in seconds (float64)
+        turn_starts: Turn start times, sorted ascending (float64)
+        turn_ends: Turn end times, in the same order as turn_starts (float64)
+        label_idx: Integer speaker label of each turn (int32)
+
+    Returns:
+        int32 array with the label index for each midpoint, or -1 if no turn matches
+    """
+    if turn_starts.size == 0:
+        return np.full(mids.size, -1, dtype=np.int32)
+
+    max_ends = np.maximum.accumulate(turn_ends)
+
+    if njit is not None:
+        return _assign_kernel(mids, turn_starts, turn_ends, max_ends, label_idx)
+    return _assign_numpy(mids, turn_starts, turn_ends, max_ends, label_idx)
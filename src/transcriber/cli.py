@@ -8,20 +8,12 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from .transcriber import AudioTranscriber
-from .formatter import OutputFormatter
-
-# Suppress warnings for cleaner output
-logging.getLogger("lightning").setLevel(logging.ERROR)
-logging.getLogger("pytorch_lightning").setLevel(logging.ERROR)
-
 
 def main():
     """Main function with command-line interface."""
     # Load environment variables from .env file in current directory or home
     load_dotenv()
-    if Path.home().joinpath('.env').exists():
-        load_dotenv(Path.home() / '.env')
+    load_dotenv(Path.home() / '.env', override=False)  # checks and skips a missing file itself
     
     parser = argparse.ArgumentParser(
         description="Transcribe audio with speaker diarization",
@@ -34,7 +26,6 @@ Examples:
 
 Requirements:
     - Set HUGGINGFACE_TOKEN in environment or .env file for speaker diarization
-    - Install ffmpeg for audio format conversion: sudo pacman -S ffmpeg (Linux) or brew install ffmpeg (Mac)
         """
     )
     
@@ -48,6 +39,18 @@ Requirements:
         choices=["tiny", "base", "small", "medium", "large"],
         help="Whisper model size (default: base)"
     )
+    parser.add_argument(
+        "--backend",
+        default="faster-whisper",
+        choices=["faster-whisper", "openai-whisper"],
+        help="Transcription backend (default: faster-whisper)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Audio windows transcribed per batch, faster-whisper only; 1 disables batching (default: 8)"
+    )
     parser.add_argument(
         "--min-speakers",
         type=int,
@@ -91,11 +94,22 @@ Requirements:
         input_path = Path(args.audio_file)
         output_file = output_dir / input_path.stem
     
+    # Import the heavy torch/pyannote stack only once there is work to do,
+    # so --help and argument errors return immediately
+    from .transcriber import AudioTranscriber
+    from .formatter import OutputFormatter
+    
+    # Suppress warnings for cleaner output
+    logging.getLogger("lightning").setLevel(logging.ERROR)
+    logging.getLogger("pytorch_lightning").setLevel(logging.ERROR)
+    
     try:
         # Initialize transcriber
         transcriber = AudioTranscriber(
             model_size=args.model,
-            device=args.device
+            device=args.device,
+            backend=args.backend,
+            batch_size=args.batch_size
         )
         
         # Perform transcription with diarization
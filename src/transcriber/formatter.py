@@ -1,8 +1,16 @@
 """Output formatting for transcription results."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class OutputFormatter:
@@ -25,30 +33,73 @@ class OutputFormatter:
         millisecs = int((seconds % 1) * 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
     
+    @classmethod
+    def _format_times_bulk(cls, starts: np.ndarray, ends: np.ndarray, srt: bool) -> Tuple[List[str], List[str]]:
+        """
+        Format many start/end times at once.
+        
+        The hour/minute/second arithmetic is done on integer arrays, leaving
+        only the final string formatting to Python.
+        
+        Args:
+            starts: Segment start times in seconds
+            ends: Segment end times in seconds
+            srt: Use SRT format (HH:MM:SS,mmm) instead of HH:MM:SS
+            
+        Returns:
+            Tuple of (formatted_starts, formatted_ends)
+        """
+        return cls._format_array(starts, srt), cls._format_array(ends, srt)
+    
+    @staticmethod
+    def _format_array(seconds: np.ndarray, srt: bool) -> List[str]:
+        """Format an array of times in seconds (see _format_times_bulk)."""
+        seconds = np.asarray(seconds, dtype=np.float64)
+        
+        # Same truncation as format_time/format_srt_time: whole seconds from the
+        # float value, milliseconds from its fractional part
+        whole = np.floor(seconds).astype(np.int64)
+        hours = (whole // 3600).tolist()
+        minutes = ((whole % 3600) // 60).tolist()
+        secs = (whole % 60).tolist()
+        
+        if not srt:
+            return [f"{h:02d}:{m:02d}:{s:02d}" for h, m, s in zip(hours, minutes, secs)]
+        
+        millisecs = (np.mod(seconds, 1) * 1000).astype(np.int64).tolist()
+        return [
+            f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+            for h, m, s, ms in zip(hours, minutes, secs, millisecs)
+        ]
+    
     @classmethod
     def save_results(cls, results: Dict, output_file: str) -> None:
         """
         Save transcription results in JSON, TXT, and SRT formats.
         
         Args:
-            results: Transcription results dictionary
+            results: Transcription results with "language" and parallel
+                "starts", "ends", "texts" and "speakers" arrays
             output_file: Base output filename (extension will be added)
         """
         output_path = Path(output_file)
         if output_path.suffix:
             output_path = output_path.with_suffix("")
 
-        # Save JSON (detailed data)
         json_path = output_path.with_suffix(".json")
-        cls._save_json(results, json_path)
-
-        # Save readable text
         text_path = output_path.with_suffix(".txt")
-        cls._save_text(results, text_path)
-
-        # Save SRT subtitles
         srt_path = output_path.with_suffix(".srt")
-        cls._save_srt(results, srt_path)
+
+        # The writers are independent, so let their file I/O overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                # JSON (detailed data)
+                executor.submit(cls._save_json, results, json_path),
+                # Readable text and SRT subtitles, in one pass over the segments
+                executor.submit(cls._save_text_and_srt, results, text_path, srt_path),
+            ]
+            for future in futures:
+                future.result()
 
         print(f"\nResults saved:")
         print(f"  • {json_path} (detailed data)")
@@ -57,38 +108,59 @@ class OutputFormatter:
     
     @staticmethod
     def _save_json(results: Dict, filename: str) -> None:
-        """Save results as JSON."""
+        """Save results as JSON, with one object per segment."""
+        keys = ("start", "end", "text", "speaker")
+        data = {
+            "language": results["language"],
+            "segments": [
+                dict(zip(keys, row))
+                for row in zip(
+                    results["starts"].tolist(),
+                    results["ends"].tolist(),
+                    results["texts"],
+                    results["speakers"]
+                )
+            ]
+        }
+        
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly, skipping the text-mode encoder
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            return
+        
         with open(filename, "w", encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+            json.dump(data, f, indent=2, ensure_ascii=False)
     
     @classmethod
-    def _save_text(cls, results: Dict, filename: str) -> None:
-        """Save results as readable text."""
-        with open(filename, "w", encoding='utf-8') as f:
-            f.write(f"Language: {results['language']}\n")
-            f.write("=" * 50 + "\n\n")
+    def _save_text_and_srt(cls, results: Dict, text_filename: str, srt_filename: str) -> None:
+        """Save results as readable text and SRT subtitles in a single pass."""
+        starts = results['starts']
+        ends = results['ends']
+        text_starts, text_ends = cls._format_times_bulk(starts, ends, srt=False)
+        srt_starts, srt_ends = cls._format_times_bulk(starts, ends, srt=True)
+        
+        text_parts = [f"Language: {results['language']}\n", "=" * 50 + "\n\n"]
+        srt_parts = []
+        
+        current_speaker = None
+        for i, (text, speaker) in enumerate(zip(results['texts'], results['speakers'])):
+            # Add speaker change indicator
+            if speaker != current_speaker:
+                if current_speaker is not None:
+                    text_parts.append("\n")
+                text_parts.append(f"[{speaker}]\n")
+                current_speaker = speaker
             
-            current_speaker = None
-            for segment in results['segments']:
-                start_time = cls.format_time(segment["start"])
-                end_time = cls.format_time(segment["end"])
-                
-                # Add speaker change indicator
-                if segment['speaker'] != current_speaker:
-                    if current_speaker is not None:
-                        f.write("\n")
-                    f.write(f"[{segment['speaker']}]\n")
-                    current_speaker = segment['speaker']
-                
-                f.write(f"[{start_time} - {end_time}] {segment['text']}\n")
-    
-    @classmethod
-    def _save_srt(cls, results: Dict, filename: str) -> None:
-        """Save results as SRT subtitles."""
-        with open(filename, "w", encoding='utf-8') as f:
-            for i, segment in enumerate(results['segments'], 1):
-                start_time = cls.format_srt_time(segment["start"])
-                end_time = cls.format_srt_time(segment["end"])
-                f.write(f"{i}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{segment['speaker']}: {segment['text']}\n\n")
\ No newline at end of file
+            text_parts.append(f"[{text_starts[i]} - {text_ends[i]}] {text}\n")
+            srt_parts.append(
+                f"{i + 1}\n"
+                f"{srt_starts[i]} --> {srt_ends[i]}\n"
+                f"{speaker}: {text}\n\n"
+            )
+        
+        # Single write per file instead of several per segment
+        with open(text_filename, "w", encoding='utf-8') as f:
+            f.write("".join(text_parts))
+        with open(srt_filename, "w", encoding='utf-8') as f:
+            f.write("".join(srt_parts))
\ No newline at end of file
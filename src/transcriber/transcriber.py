@@ -3,10 +3,10 @@
 Audio Transcription with Speaker Diarization
 
 A comprehensive tool for transcribing audio files with speaker identification.
-Uses OpenAI Whisper for transcription and pyannote.audio for speaker diarization.
+Uses faster-whisper (or OpenAI Whisper) for transcription and pyannote.audio
+for speaker diarization.
 
 Requirements:
-    - ffmpeg (for audio conversion)
     - CUDA-capable GPU (optional, but recommended for speed)
     - Apple Silicon Mac with Metal support (optional, but recommended for speed)
     - HuggingFace token for pyannote models
@@ -15,33 +15,116 @@ Author: Transcription Tool
 """
 
 import os
-import subprocess
-import tempfile
 import warnings
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import Dict, List, Optional
 
+import numpy as np
 import torch
-import whisper
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
 from pyannote.audio import Pipeline
 
+from ._speaker_assign import assign_speakers
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
+# Sample rate shared by Whisper and the diarization pipeline
+SAMPLE_RATE = 16000
+
+# Mel frames in one 30s Whisper window (100 frames per second)
+N_FRAMES = 3000
+
+# Available transcription backends
+BACKENDS = ("faster-whisper", "openai-whisper")
+
+
+@lru_cache(maxsize=2)
+def _load_cached_whisper_model(backend: str, model_size: str, device: str):
+    """
+    Load a Whisper model, reusing it across AudioTranscriber instances.
+    
+    Args:
+        backend: Transcription backend ('faster-whisper' or 'openai-whisper')
+        model_size: Whisper model size
+        device: Device to load the model on
+        
+    Returns:
+        The loaded model for the given backend
+    """
+    print(f"Loading Whisper model ({model_size}, {backend})...")
+    
+    if backend == "faster-whisper":
+        # CTranslate2 has no Metal support, so MPS falls back to CPU
+        if device == "cuda":
+            return WhisperModel(model_size, device="cuda", compute_type="int8_float16")
+        return WhisperModel(model_size, device="cpu", compute_type="int8")
+    
+    try:
+        import whisper
+    except ImportError:
+        raise RuntimeError(
+            "openai-whisper is not installed. Install with: pip install 'transcriber[openai]'"
+        )
+    
+    model = whisper.load_model(model_size, device=device)
+    
+    if device == "cuda":
+        # Keep fp16 weights so they are not re-cast on every forward pass;
+        # Whisper's LayerNorm computes in fp32, so those stay fp32
+        model = model.half()
+        for module in model.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+        
+        # The encoder always sees a fixed 30s mel window, so it can be captured
+        # as a CUDA graph. The decoder is left eager: its input length grows
+        # every step and its kv-cache hooks would force constant recompiles.
+        eager_encoder = model.encoder
+        try:
+            model.encoder = torch.compile(eager_encoder, mode="reduce-overhead", fullgraph=False)
+            
+            # torch.compile is lazy: Dynamo/Inductor only run on the first forward.
+            # Warm up here, on the loading thread and default stream, with the same
+            # input shape, dtype and grad mode transcription uses, so compile errors
+            # surface now and CUDA-graph capture happens outside the worker threads.
+            dummy_mel = torch.zeros(
+                1, model.dims.n_mels, N_FRAMES, dtype=torch.float16, device=device
+            )
+            with torch.inference_mode():
+                model.encoder(dummy_mel)
+            torch.cuda.synchronize()
+        except Exception as e:
+            print(f"Warning: torch.compile failed, using eager encoder: {e}")
+            model.encoder = eager_encoder
+    
+    return model
+
 
 class AudioTranscriber:
     """Main transcription class with speaker diarization capabilities."""
     
-    def __init__(self, model_size: str = "base", device: Optional[str] = None):
+    def __init__(self, model_size: str = "base", device: Optional[str] = None,
+                 backend: str = "faster-whisper", batch_size: int = 8):
         """
         Initialize the transcriber.
         
         Args:
             model_size: Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
             device: Device to use ('cuda', 'mps', or 'cpu'). Auto-detected if None.
+            backend: Transcription backend ('faster-whisper' or 'openai-whisper')
+            batch_size: Number of 30s windows decoded per forward pass (faster-whisper
+                only; 1 disables batching)
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Choose from: {', '.join(BACKENDS)}")
+        
         self.device = device or self._get_best_device()
         self.model_size = model_size
+        self.backend = backend
+        self.batch_size = batch_size
         self.whisper_model = None
         self.diarization_pipeline = None
         
@@ -69,8 +152,7 @@ class AudioTranscriber:
     def _load_whisper_model(self) -> None:
         """Load the Whisper model for transcription."""
         if self.whisper_model is None:
-            print(f"Loading Whisper model ({self.model_size})...")
-            self.whisper_model = whisper.load_model(self.model_size, device=self.device)
+            self.whisper_model = _load_cached_whisper_model(self.backend, self.model_size, self.device)
     
     def _load_diarization_pipeline(self) -> bool:
         """
@@ -118,44 +200,23 @@ class AudioTranscriber:
         
         return True
     
-    def _convert_audio_format(self, audio_file: str) -> Tuple[str, bool]:
+    def _load_waveform(self, audio_file: str) -> np.ndarray:
         """
-        Convert audio to WAV format if needed for diarization compatibility.
+        Decode the audio file once into a 16kHz mono waveform.
+        
+        The same array is fed to both Whisper and the diarization pipeline,
+        so the file is decoded a single time and no temporary WAV is written.
         
         Args:
             audio_file: Path to the input audio file
             
         Returns:
-            Tuple of (converted_file_path, is_temporary_file)
+            Float32 waveform sampled at 16kHz
         """
-        file_ext = Path(audio_file).suffix.lower()
-        
-        # Return original file if already WAV
-        if file_ext == '.wav':
-            return audio_file, False
-        
-        # Create temporary WAV file
-        temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        temp_wav.close()
-        
-        print(f"Converting {file_ext} to WAV for diarization...")
-        
         try:
-            subprocess.run([
-                'ffmpeg', '-i', audio_file,
-                '-acodec', 'pcm_s16le',  # 16-bit PCM
-                '-ar', '16000',          # 16kHz sample rate
-                '-ac', '1',              # Mono
-                '-y',                    # Overwrite output
-                temp_wav.name
-            ], check=True, capture_output=True, text=True)
-            
-            return temp_wav.name, True
-            
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Audio conversion failed: {e.stderr}")
-        except FileNotFoundError:
-            raise RuntimeError("ffmpeg not found. Install with: sudo pacman -S ffmpeg")
+            return decode_audio(audio_file, sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            raise RuntimeError(f"Audio decoding failed: {e}")
     
     def transcribe(self, audio_file: str, min_speakers: int = 2, max_speakers: int = 4) -> Dict:
         """
@@ -167,83 +228,171 @@ class AudioTranscriber:
             max_speakers: Maximum number of speakers expected
             
         Returns:
-            Dictionary containing transcription results with speaker labels
+            Dictionary with the detected "language" and per-segment parallel
+            arrays: "starts" and "ends" (float64 ndarrays, in seconds),
+            "texts" and "speakers" (lists of str)
         """
         print(f"Processing: {audio_file}")
         print(f"Expected speakers: {min_speakers}-{max_speakers}")
         
-        # Load Whisper model
+        # Load both models up front so loading is not part of the concurrent run
         self._load_whisper_model()
-        
-        # Transcribe audio
-        print("Transcribing audio...")
-        result = self.whisper_model.transcribe(audio_file, verbose=False)
-        print(f"Language detected: {result['language']}")
-        
-        # Attempt speaker diarization
         diarization_available = self._load_diarization_pipeline()
         
-        if diarization_available:
-            # Convert audio format if needed
-            diarization_audio, is_temp = self._convert_audio_format(audio_file)
+        # Decode once and share the waveform between both models
+        waveform = self._load_waveform(audio_file)
+        
+        # Run transcription and diarization concurrently when a GPU is involved;
+        # they are independent passes. On CPU both would compete for the same
+        # cores (CTranslate2 and torch each size their pools to all of them), so
+        # a single worker runs them one after the other instead.
+        # Grad mode and the current CUDA stream are thread-local, so each
+        # worker sets up its own contexts.
+        max_workers = 1 if self.device == "cpu" else 2
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            print("Transcribing audio...")
+            transcription_future = executor.submit(self._run_transcription, waveform)
             
-            try:
+            diarization_future = None
+            if diarization_available:
                 print("Performing speaker diarization...")
-                diarization = self.diarization_pipeline(
-                    diarization_audio,
-                    min_speakers=min_speakers,
-                    max_speakers=max_speakers
+                diarization_future = executor.submit(
+                    self._run_diarization, waveform, min_speakers, max_speakers
                 )
-                
-                # Combine transcription with diarization
-                print("Combining transcription with speaker labels...")
-                final_segments = self._combine_transcription_and_diarization(
-                    result["segments"], diarization
-                )
-                
-            finally:
-                # Clean up temporary file
-                if is_temp and os.path.exists(diarization_audio):
-                    os.unlink(diarization_audio)
+            
+            result = transcription_future.result()
+            print(f"Language detected: {result['language']}")
+            
+            diarization = diarization_future.result() if diarization_future else None
+        
+        if diarization is not None:
+            # Combine transcription with diarization
+            print("Combining transcription with speaker labels...")
+            speakers = self._combine_transcription_and_diarization(
+                result["starts"], result["ends"], diarization
+            )
         else:
             # Use transcription without diarization
             print("Using transcription without speaker diarization...")
-            final_segments = [
-                {
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "text": segment["text"].strip(),
-                    "speaker": "SPEAKER_1"
-                }
-                for segment in result["segments"]
-            ]
+            speakers = ["SPEAKER_1"] * len(result["texts"])
         
         return {
             "language": result["language"],
-            "segments": final_segments
+            "starts": result["starts"],
+            "ends": result["ends"],
+            "texts": result["texts"],
+            "speakers": speakers
         }
     
-    def _combine_transcription_and_diarization(self, segments: List[Dict], diarization) -> List[Dict]:
-        """Combine Whisper transcription with pyannote diarization results."""
-        final_segments = []
+    @contextmanager
+    def _device_stream(self):
+        """
+        Run the enclosed torch GPU work on its own CUDA stream.
         
-        for segment in segments:
-            segment_start = segment["start"]
-            segment_end = segment["end"]
-            segment_mid = (segment_start + segment_end) / 2
-            
-            # Find speaker at segment midpoint
-            speaker = "UNKNOWN"
-            for turn, _, speaker_label in diarization.itertracks(yield_label=True):
-                if turn.start <= segment_mid <= turn.end:
-                    speaker = speaker_label
-                    break
-            
-            final_segments.append({
-                "start": segment_start,
-                "end": segment_end,
-                "text": segment["text"].strip(),
-                "speaker": speaker
-            })
-        
-        return final_segments
\ No newline at end of file
+        No-op on other devices. Only torch models use it: CTranslate2
+        (faster-whisper) manages its own CUDA streams.
+        """
+        if self.device != "cuda":
+            yield
+            return
+        
+        stream = torch.cuda.Stream()
+        with torch.cuda.stream(stream):
+            yield
+        stream.synchronize()
+    
+    def _run_transcription(self, waveform: np.ndarray) -> Dict:
+        """
+        Run Whisper on the decoded waveform.
+        
+        Returns:
+            Dictionary with the detected language and parallel "starts",
+            "ends" and "texts" arrays, independent of the backend used.
+        """
+        # faster-whisper runs on CTranslate2, which ignores torch streams
+        stream = self._device_stream() if self.backend == "openai-whisper" else nullcontext()
+        with torch.inference_mode(), stream:
+            if self.backend == "faster-whisper":
+                if self.batch_size > 1:
+                    # VAD splits the audio into speech chunks that are decoded in batches.
+                    # Timestamps stay on so segments keep utterance granularity rather
+                    # than spanning a whole chunk, which would blur speaker assignment.
+                    segments, info = BatchedInferencePipeline(model=self.whisper_model).transcribe(
+                        waveform,
+                        batch_size=self.batch_size,
+                        beam_size=5,
+                        vad_filter=True,
+                        without_timestamps=False
+                    )
+                else:
+                    segments, info = self.whisper_model.transcribe(
+                        waveform, beam_size=5, vad_filter=True
+                    )
+                segments = [(segment.start, segment.end, segment.text) for segment in segments]
+                language = info.language
+            else:
+                result = self.whisper_model.transcribe(
+                    waveform,
+                    verbose=False,
+                    fp16=self.device != "cpu"
+                )
+                segments = [
+                    (segment["start"], segment["end"], segment["text"])
+                    for segment in result["segments"]
+                ]
+                language = result["language"]
+        
+        return {
+            "language": language,
+            "starts": np.array([start for start, _, _ in segments], dtype=np.float64),
+            "ends": np.array([end for _, end, _ in segments], dtype=np.float64),
+            "texts": [text.strip() for _, _, text in segments]
+        }
+    
+    def _run_diarization(self, waveform: np.ndarray, min_speakers: int, max_speakers: int):
+        """Run the diarization pipeline on the decoded waveform."""
+        audio = {
+            "waveform": torch.from_numpy(waveform).unsqueeze(0),
+            "sample_rate": SAMPLE_RATE
+        }
+        with torch.inference_mode(), self._device_stream():
+            return self.diarization_pipeline(
+                audio,
+                min_speakers=min_speakers,
+                max_speakers=max_speakers
+            )
+    
+    def _combine_transcription_and_diarization(self, seg_starts: np.ndarray, seg_ends: np.ndarray,
+                                               diarization) -> List[str]:
+        """
+        Combine Whisper transcription with pyannote diarization results.
+        
+        Returns the speaker label of each segment. Each segment is assigned
+        the speaker whose turn contains the segment midpoint. Turns are
+        sorted by start time once, and every midpoint is located with a
+        binary search instead of scanning all turns (see _speaker_assign).
+        """
+        # Materialize the turns once; itertracks walks the whole Timeline per call
+        turns = [(turn.start, turn.end, label) for turn, _, label in diarization.itertracks(yield_label=True)]
+        
+        # Encode labels as integers so the lookup kernel stays numeric
+        label_ids = {}
+        turn_starts = np.array([start for start, _, _ in turns], dtype=np.float64)
+        turn_ends = np.array([end for _, end, _ in turns], dtype=np.float64)
+        turn_label_idx = np.array(
+            [label_ids.setdefault(label, len(label_ids)) for _, _, label in turns],
+            dtype=np.int32
+        )
+        
+        order = np.argsort(turn_starts, kind="stable")
+        
+        mids = 0.5 * (seg_starts + seg_ends)
+        
+        speaker_idx = assign_speakers(
+            mids, turn_starts[order], turn_ends[order], turn_label_idx[order]
+        )
+        
+        # Decode into a presized array in one take; unmatched segments (-1)
+        # resolve to the trailing "UNKNOWN" entry
+        label_names = np.array(list(label_ids) + ["UNKNOWN"], dtype=object)
+        return label_names.take(speaker_idx).tolist()
\ No newline at end of file
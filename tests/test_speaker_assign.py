@@ -0,0 +1,84 @@
+"""Tests for the speaker assignment kernels."""
+
+import numpy as np
+import pytest
+
+from transcriber import _speaker_assign
+from transcriber._speaker_assign import assign_speakers
+
+# Exercise the plain-Python kernel body whether or not Numba compiled it
+_kernel = getattr(_speaker_assign._assign_kernel, "py_func", _speaker_assign._assign_kernel)
+
+IMPLEMENTATIONS = [
+    pytest.param(_speaker_assign._assign_numpy, id="numpy"),
+    pytest.param(_kernel, id="kernel"),
+]
+
+
+def _reference(mids, turn_starts, turn_ends, label_idx):
+    """Brute force: label of the latest-starting turn containing each midpoint."""
+    out = []
+    for m in mids:
+        found = -1
+        for j in range(len(turn_starts) - 1, -1, -1):
+            if turn_starts[j] <= m <= turn_ends[j]:
+                found = label_idx[j]
+                break
+        out.append(found)
+    return np.array(out, dtype=np.int32)
+
+
+def _run(impl, mids, turn_starts, turn_ends, label_idx):
+    mids = np.asarray(mids, dtype=np.float64)
+    turn_starts = np.asarray(turn_starts, dtype=np.float64)
+    turn_ends = np.asarray(turn_ends, dtype=np.float64)
+    label_idx = np.asarray(label_idx, dtype=np.int32)
+    max_ends = np.maximum.accumulate(turn_ends)
+    return impl(mids, turn_starts, turn_ends, max_ends, label_idx)
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+def test_overlapping_turns(impl):
+    # Turn 1 starts inside turn 0; the midpoint in the overlap goes to the later turn
+    result = _run(impl, [1.0, 2.5, 3.5], [0.0, 2.0], [3.0, 4.0], [0, 1])
+    assert result.tolist() == [0, 1, 1]
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+def test_long_early_turn(impl):
+    # The latest turn before 8.0 has ended, but the long first turn still covers it
+    result = _run(impl, [8.0, 12.0], [0.0, 1.0, 2.0], [10.0, 1.5, 3.0], [0, 1, 2])
+    assert result.tolist() == [0, -1]
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+def test_midpoint_on_boundary(impl):
+    # Turns are closed intervals; a shared boundary goes to the later-starting turn
+    result = _run(impl, [0.0, 2.0, 4.0, 4.5, -0.1], [0.0, 2.0], [2.0, 4.0], [0, 1])
+    assert result.tolist() == [0, 1, 1, -1, -1]
+
+
+def test_no_turns():
+    result = assign_speakers(
+        np.array([0.5, 1.0]),
+        np.array([], dtype=np.float64),
+        np.array([], dtype=np.float64),
+        np.array([], dtype=np.int32),
+    )
+    assert result.dtype == np.int32
+    assert result.tolist() == [-1, -1]
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+def test_matches_reference_on_random_turns(impl):
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        n = int(rng.integers(1, 20))
+        turn_starts = np.sort(rng.uniform(0, 100, n))
+        turn_ends = turn_starts + rng.uniform(0, 30, n)
+        label_idx = rng.integers(0, 4, n).astype(np.int32)
+        mids = rng.uniform(-5, 140, 50)
+
+        expected = _reference(mids, turn_starts, turn_ends, label_idx)
+        result = _run(impl, mids, turn_starts, turn_ends, label_idx)
+        np.testing.assert_array_equal(result, expected)